@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+# Per-page text helpers kept free of dynamic features so the module can be
+# compiled with mypyc (see README); the plain .py is used otherwise.
+
+import datetime
+import re
+from typing import Optional
+
+from selectolax.lexbor import LexborHTMLParser
+
+_WS = re.compile(r"\s+")
+# German dates as printed by dejure, e.g. "12.06.2025"
+DATE_RE = re.compile(r"\b(\d{1,2})\.(\d{1,2})\.((?:19|20)\d{2})\b")
+# File numbers like "III ZR 109/24", "2 StR 45/22", "1 BvR 2011/22", "C-123/45"
+AZ_RE = re.compile(r"(?:\b(?:[IVX]+[a-z]?|\d+)\s+)?\b(?:ZR|ZB|StR|BvR|AZR|C-|Az\.)\s*[^\s/]*\d+/\d+\b")
+# Court abbreviations recognised in page headers
+COURT_KW = ("BVerfG", "BGH", "BAG", "BSG", "BFH", "EuGH", "EGMR", "VG", "OVG", "VGH", "LG", "OLG", "AG")
+COURT_RE = re.compile(r"\b(" + "|".join(COURT_KW) + r")\b")
+SEL_MAIN = "main, article, #content, .content, #main, .hauptinhalt"
+
+
+def _clean_text(s: Optional[str]) -> str:
+    if not s:
+        return ""
+    return _WS.sub(" ", s).strip()
+
+
+def _parse_date(text: str) -> str:
+    # First dd.mm.yyyy in text that is a real calendar date, as ISO 8601
+    for m in DATE_RE.finditer(text):
+        try:
+            return datetime.date(int(m.group(3)), int(m.group(2)), int(m.group(1))).isoformat()
+        except ValueError:
+            continue
+    return ""
+
+
+def _parse_file_number(text: str) -> str:
+    m = AZ_RE.search(text)
+    return m.group(0).strip(";,.()[]") if m else ""
+
+
+def _parse_court(text: str) -> str:
+    m = COURT_RE.search(text)
+    return m.group(1) if m else ""
+
+
+def _extract_main_text(tree: LexborHTMLParser) -> str:
+    # Heuristics to get prominent content text on dejure pages
+    candidates: list[str] = []
+    # Prefer article/main content blocks if present
+    for el in tree.css(SEL_MAIN):
+        txt = _clean_text(el.text(separator="\n"))
+        if len(txt) > 500:
+            candidates.append(txt)
+    if candidates:
+        return max(candidates, key=len)
+    # Fallback: longest text block in page
+    root = tree.root
+    return _clean_text(root.text(separator="\n")) if root is not None else ""
@@ -1,66 +1,132 @@
 import argparse
+import asyncio
 import csv
-import json
+import hashlib
+import io
 import os
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Iterable, Optional, Dict, Any
+from typing import BinaryIO, Iterable, Optional, Dict, Any, Sequence, TextIO
+
+import orjson
 
 from .scraper import DejureScraper, CaseRecord
 
 
-def _write_jsonl(path: Path, records: Iterable[CaseRecord]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        for rec in records:
-            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+# Columns of the optional flattened CSV output
+_CSV_KEYS = ("url", "court", "date", "file_number", "title", "leitsatz", "tenor", "full_text")
+
+# Records buffered per write; each batch becomes a single write() per output file
+BATCH_SIZE = 1000
+# Longest a buffered record waits before its batch is written anyway
+FLUSH_SECONDS = 5.0
+
+
+def _append_jsonl(fh: BinaryIO, records: Iterable[CaseRecord]) -> None:
+    fh.write(b"".join(orjson.dumps(rec) + b"\n" for rec in records))
+    fh.flush()
+
 
+def _ensure_csv_schema(path: Path, fieldnames: Sequence[str]) -> None:
+    """Make sure ``path`` starts with the current header, migrating it once if not.
 
-def _write_csv(path: Path, records: Iterable[CaseRecord]) -> None:
+    Runs once per CLI invocation so that ``_append_csv`` can always append. A
+    ``.schema`` sidecar holding a hash of the header skips even the header
+    read when the file was already written with the current schema.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "url",
-        "court",
-        "date",
-        "file_number",
-        "title",
-        "leitsatz",
-        "tenor",
-        "full_text",
-    ]
+    header = ",".join(fieldnames)
+    digest = hashlib.sha256(header.encode("utf-8")).hexdigest()
+    schema_path = path.with_suffix(".schema")
+    if path.exists() and schema_path.exists() and schema_path.read_text(encoding="utf-8").strip() == digest:
+        return
+
     # If file exists with an older header, rewrite the file with new schema
+    rewrite = True
     existing_rows: list[Dict[str, Any]] = []
-    if path.exists():
+    if path.exists() and path.stat().st_size:
         try:
             with path.open("r", encoding="utf-8", newline="") as rf:
-                reader = csv.DictReader(rf)
-                old_fields = reader.fieldnames or []
-                # If header differs from expected, migrate
-                if set(old_fields) != set(fieldnames):
-                    for row in reader:
-                        # map to new fields; keep missing as empty
-                        existing_rows.append({k: row.get(k, "") for k in fieldnames})
-                    # Rewrite after merging with new batch below
+                if rf.readline().rstrip("\r\n") == header:
+                    rewrite = False
                 else:
-                    # No migration needed; we'll append directly below
-                    with path.open("a", encoding="utf-8", newline="") as f:
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        for rec in records:
-                            row: Dict[str, Any] = {k: rec.get(k, "") for k in fieldnames}
-                            writer.writerow(row)
-                    return
+                    rf.seek(0)
+                    # map to new fields; keep missing as empty
+                    existing_rows = [{k: row.get(k, "") for k in fieldnames} for row in csv.DictReader(rf)]
         except Exception:
             # If anything goes wrong reading, fall back to rewriting fresh with new header
             existing_rows = []
 
-    # If we reach here we either have no file or we need migration; write fresh
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    if rewrite:
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=fieldnames)
         writer.writeheader()
-        for row in existing_rows:
-            writer.writerow(row)
-        for rec in records:
-            row: Dict[str, Any] = {k: rec.get(k, "") for k in fieldnames}
-            writer.writerow(row)
+        writer.writerows(existing_rows)
+        with path.open("w", encoding="utf-8", newline="") as f:
+            f.write(buf.getvalue())
+    schema_path.write_text(digest + "\n", encoding="utf-8")
+
+
+def _append_csv(fh: TextIO, records: Iterable[CaseRecord]) -> None:
+    # Header is guaranteed by _ensure_csv_schema; batches only ever append
+    buf = io.StringIO()
+    csv.writer(buf).writerows([[rec.get(k, "") for k in _CSV_KEYS] for rec in records])
+    fh.write(buf.getvalue())
+    fh.flush()
+
+
+def _write_batch(jsonl_fh: BinaryIO, csv_fh: Optional[TextIO], batch: list[CaseRecord]) -> None:
+    _append_jsonl(jsonl_fh, batch)
+    if csv_fh:
+        _append_csv(csv_fh, batch)
+
+
+async def _scrape(scraper: DejureScraper, jsonl_fh: BinaryIO, csv_fh: Optional[TextIO]) -> int:
+    # Writer stage: records queued by the crawl are flushed every BATCH_SIZE
+    # records or FLUSH_SECONDS after the oldest unwritten one, whichever comes
+    # first. Writes run on a thread so the crawl keeps going meanwhile.
+    queue: asyncio.Queue[Optional[CaseRecord]] = asyncio.Queue(maxsize=BATCH_SIZE)
+
+    async def produce() -> None:
+        try:
+            async for rec in scraper.run_async():
+                await queue.put(rec)
+        finally:
+            await queue.put(None)
+
+    loop = asyncio.get_running_loop()
+    written = 0
+    batch: list[CaseRecord] = []
+    deadline = 0.0
+
+    async def flush() -> None:
+        nonlocal written, batch
+        if batch:
+            await asyncio.to_thread(_write_batch, jsonl_fh, csv_fh, batch)
+            written += len(batch)
+            batch = []
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            timeout = max(0.0, deadline - loop.time()) if batch else None
+            try:
+                rec = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                await flush()
+                continue
+            if rec is None:
+                break
+            if not batch:
+                deadline = loop.time() + FLUSH_SECONDS
+            batch.append(rec)
+            if len(batch) >= BATCH_SIZE:
+                await flush()
+        await flush()
+        await producer
+    finally:
+        producer.cancel()
+    return written
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -73,6 +139,8 @@ def build_parser() -> argparse.ArgumentParser:
                    help="Max pages to visit (0 = unlimited). Default: 50")
     p.add_argument("--delay", type=float, default=2.0,
                    help="Seconds delay between requests. Default: 2.0")
+    p.add_argument("--concurrency", type=int, default=4,
+                   help="Max requests in flight; per-host spacing is delay/concurrency. Default: 4")
     p.add_argument("--only-court", type=str, default="",
                    help="Optional court key/name filter (substring match against link text)")
     p.add_argument("--user-agent", type=str, default="gesagent-dejurescrape/1.0",
@@ -95,24 +163,16 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         user_agent=args.user_agent,
         court_filter=args.only_court or None,
         max_pages=args.max_pages if args.max_pages and args.max_pages > 0 else None,
+        concurrency=args.concurrency,
     )
 
-    written = 0
-    batch: list[CaseRecord] = []
-    for rec in scraper.run():
-        batch.append(rec)
-        if len(batch) >= 10:
-            _write_jsonl(jsonl_path, batch)
-            if csv_path:
-                _write_csv(csv_path, batch)
-            written += len(batch)
-            batch.clear()
-
-    if batch:
-        _write_jsonl(jsonl_path, batch)
-        if csv_path:
-            _write_csv(csv_path, batch)
-        written += len(batch)
+    if csv_path:
+        _ensure_csv_schema(csv_path, _CSV_KEYS)
+    # Output files stay open for the whole run; batches are appended to them
+    with ExitStack() as stack:
+        jsonl_fh = stack.enter_context(jsonl_path.open("ab"))
+        csv_fh = stack.enter_context(csv_path.open("a", encoding="utf-8", newline="")) if csv_path else None
+        written = asyncio.run(_scrape(scraper, jsonl_fh, csv_fh))
 
     print(f"Wrote {written} records to {jsonl_path}" + (f" and {csv_path}" if csv_path else ""))
     return 0
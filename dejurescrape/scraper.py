@@ -1,14 +1,74 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+import re
 import time
 import urllib.robotparser
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
-from typing import Iterator, Optional, Dict, Any, TypedDict
+from typing import AsyncIterator, Iterator, Optional, Dict, Any, TypedDict
+from urllib.parse import quote, unquote, urlparse, urlsplit, urlunparse
 
 import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+from urllib3.util import Retry
+
+from ._fast import _clean_text, _extract_main_text, _parse_court, _parse_date, _parse_file_number
+
+
+# Official / reputable hosts to follow for full text, in order of preference
+PREFERRED_HOSTS = (
+    "bundesgerichtshof.de",
+    "bverfg.de",
+    "rechtsprechung-im-internet.de",
+    "openjur.de",
+    "rechtsinformationen.bund.de",
+    "eur-lex.europa.eu",
+)
+HOST_RE = re.compile("|".join(re.escape(h) for h in PREFERRED_HOSTS))
+HOST_RANK = {h: i for i, h in enumerate(PREFERRED_HOSTS)}
+# Full-text targets tried per case, best-ranked hosts first
+MAX_FULLTEXT_HOPS = 2
+# Markers that make link text look like a case citation
+AZ_TOKENS = ("ZR", "ZB", "StR", "BvR", "C-", "AZ", "Az.")
+AZ_TOKEN_RE = re.compile("|".join(re.escape(t) for t in AZ_TOKENS))
+# Links on the index that are not court pages
+SKIP_SEG_RE = re.compile(r"/(?:gesetze|corona|benutzer|stellenmarkt|dienste/vernetzung/rechtsprechung)")
+# Links to other decisions
+CASE_REF_RE = re.compile(r"/(?:urteil|entscheidung|rechtsprechung)")
+# Section names that only occur in the text of a judgment
+JUDGMENT_RE = re.compile(r"Tatbestand|Entscheidungsgründe|Tenor|Gründe")
+
+# CSS selectors shared by every page; Lexbor compiles them natively per query
+SEL_A = "a"
+SEL_HEADERS = "h1, h2, .kopf, .header, .entscheidung, .az, .aktenzeichen"
+SEL_BREADCRUMB = ".breadcrumb a, nav.breadcrumb a"
+SEL_AZ = ".az, .aktenzeichen"
+SEL_HEADINGS = "h2, h3, strong"
+SEL_META_ROBOTS = 'meta[name="robots"]'
+
+# Record fields filled from the text following a heading containing one of the words
+SECTION_HEADINGS = {"leitsatz": ("leitsatz",), "tenor": ("tenor",)}
+
+# Longest Retry-After (seconds) honoured inline before a single retry
+MAX_RETRY_AFTER = 30
+
+# Full-text target URLs remembered across cases (extracted text, or "" for no match)
+FULLTEXT_CACHE_SIZE = 10_000
+
+# Bodies are read in chunks and cut off past this size
+MAX_BODY_BYTES = 2_000_000
+# <meta charset=...> / http-equiv declaration, looked for near the top of a body
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)""", re.I)
 
 
 class CaseRecord(TypedDict, total=False):
@@ -27,97 +87,179 @@ class FetchError(Exception):
     pass
 
 
-def _is_meta_disallowed(soup: BeautifulSoup) -> bool:
-    tag = soup.find("meta", attrs={"name": "robots"})
-    if not tag:
+class FinalFetchError(FetchError):
+    # Server error that was already retried (after Retry-After, or by the
+    # adapter for 502/504); _get's backoff chain leaves it alone
+    pass
+
+
+def _is_meta_disallowed(tree: LexborHTMLParser) -> bool:
+    tag = tree.css_first(SEL_META_ROBOTS)
+    if tag is None:
         return False
-    content = (tag.get("content") or "").lower()
+    content = (tag.attributes.get("content") or "").lower()
     return "noindex" in content or "nofollow" in content
 
 
-def _clean_text(s: str | None) -> str:
-    if not s:
-        return ""
-    return " ".join(s.split())
+def _retry_after(resp: requests.Response) -> Optional[int]:
+    value = (resp.headers.get("Retry-After") or "").strip()
+    if value.isdigit() and int(value) <= MAX_RETRY_AFTER:
+        return int(value)
+    return None
 
 
 @retry(
     reraise=True,
     stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=8),
-    retry=retry_if_exception_type(FetchError),
+    wait=wait_exponential(multiplier=0.5, min=0.5, max=4),
+    retry=retry_if_exception_type(FetchError) & retry_if_not_exception_type(FinalFetchError),
 )
 def _get(session: requests.Session, url: str) -> requests.Response:
-    resp = session.get(url, timeout=20)
+    resp = session.get(url, timeout=20, stream=True)
+    if resp.status_code in (429, 503):
+        # Wait as long as the server asks once, rather than guessing with backoff
+        wait = _retry_after(resp)
+        if wait is not None:
+            resp.close()
+            time.sleep(wait)
+            resp = session.get(url, timeout=20, stream=True)
+            if resp.status_code >= 500:
+                resp.close()
+                raise FinalFetchError(f"Server error {resp.status_code} for {url} after Retry-After")
+            return resp
+    if resp.status_code in (502, 504):
+        resp.close()
+        raise FinalFetchError(f"Server error {resp.status_code} for {url}")
     if resp.status_code >= 500:
+        resp.close()
         raise FetchError(f"Server error {resp.status_code} for {url}")
     return resp
 
 
-def _extract_main_text(soup: BeautifulSoup) -> str:
-    # Heuristics to get prominent content text on dejure pages
-    candidates = []
-    # Prefer article/main content blocks if present
-    for sel in [
-        "main",
-        "article",
-        "#content",
-        ".content",
-        "#main",
-        ".hauptinhalt",
-    ]:
-        for el in soup.select(sel):
-            txt = _clean_text(el.get_text("\n"))
-            if len(txt) > 500:
-                candidates.append(txt)
-    if candidates:
-        return max(candidates, key=len)
-    # Fallback: longest text block in page
-    return _clean_text(soup.get_text("\n"))
-
-
-def _fetch_full_text_from_targets(session: requests.Session, base_url: str, soup: BeautifulSoup, delay_seconds: float) -> str:
-    # Look for the "Volltextveröffentlichungen" section and follow reputable links
-    preferred_hosts = [
-        "bundesgerichtshof.de",
-        "bverfg.de",
-        "rechtsprechung-im-internet.de",
-        "openjur.de",
-        "rechtsinformationen.bund.de",
-        "eur-lex.europa.eu",
-    ]
-    links: list[str] = []
-    for a in soup.find_all("a"):
-        href = a.get("href") or ""
-        if href.startswith("/"):
-            href = f"{base_url}{href}"
-        if href.startswith("http") and any(host in href for host in preferred_hosts):
-            links.append(href)
-    # Try preferred links first, then any external links if needed
-    tried: set[str] = set()
-    ordered = links + [
-        href if href.startswith("http") else f"{base_url}{href}"
-        for href in {a.get("href") or "" for a in soup.find_all("a")}
-        if href and href.startswith("http") and href not in links
-    ]
-    for url in ordered:
-        if url in tried:
-            continue
-        tried.add(url)
-        # Be polite
-        if delay_seconds:
-            time.sleep(delay_seconds)
+def _read_body(resp: requests.Response, limit: int = MAX_BODY_BYTES) -> bytes:
+    # Only a bounded amount of text is ever used, so stop reading once past the cap
+    chunks: list[bytes] = []
+    size = 0
+    try:
+        for chunk in resp.iter_content(65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > limit:
+                break
+    finally:
+        resp.close()
+    return b"".join(chunks)
+
+
+def _download(session: requests.Session, url: str) -> tuple[requests.Response, bytes]:
+    # Raw UTF-8 bytes for the parser. resp.text is avoided on purpose: without
+    # a declared charset it runs charset detection over the whole body, and
+    # dejure and the court sites serve UTF-8 anyway.
+    resp = _get(session, url)
+    ct = (resp.headers.get("content-type") or "").lower()
+    if ct and "html" not in ct:
+        # Never pull e.g. PDFs through the HTML pipeline
+        resp.close()
+        return resp, b""
+    body = _read_body(resp)
+    charset = ct.partition("charset=")[2].split(";", 1)[0].strip(" \"'")
+    return resp, _to_utf8(body, charset)
+
+
+def _codec(charset: str) -> Optional[str]:
+    try:
+        return codecs.lookup(charset).name if charset else None
+    except LookupError:
+        return None
+
+
+def _to_utf8(body: bytes, charset: str = "") -> bytes:
+    # Lexbor drops the text of nodes that are not valid UTF-8, so anything else
+    # is transcoded here: the HTTP charset first, then a <meta> declaration,
+    # then UTF-8 with replacement characters.
+    codec = _codec(charset)
+    if codec is None or codec == "utf-8":
         try:
-            r = _get(session, url)
-            if (r.headers.get("content-type") or "").lower().startswith("text/html"):
-                sub = BeautifulSoup(r.text, "lxml")
-                text = _extract_main_text(sub)
-                # Heuristic threshold: consider it a judgment if long enough
-                if len(text) > 1500 and any(k in text for k in ("Tatbestand", "Entscheidungsgründe", "Tenor", "Gründe")):
-                    return text
-        except Exception:
-            continue
-    return ""
+            body.decode("utf-8")
+            return body
+        except UnicodeDecodeError:
+            pass
+        m = META_CHARSET_RE.search(body, 0, 2048)
+        codec = _codec(m.group(1).decode("ascii")) if m else None
+        if codec is None:
+            codec = "utf-8"
+    return body.decode(codec, errors="replace").encode("utf-8")
+
+
+def _compile_robots(
+    robots: urllib.robotparser.RobotFileParser, useragent: str
+) -> Optional[tuple[re.Pattern[str], tuple[bool, ...]]]:
+    # The rules of the entry can_fetch would consult, as one anchored
+    # alternation; the leftmost matching alternative is the first matching
+    # rule, exactly like RobotFileParser's in-order scan.
+    entry = next((e for e in robots.entries if e.applies_to(useragent)), robots.default_entry)
+    if entry is None or not entry.rulelines:
+        return None
+    pattern = "|".join("()" if line.path == "*" else f"({re.escape(line.path)})" for line in entry.rulelines)
+    return re.compile(f"^(?:{pattern})"), tuple(line.allowance for line in entry.rulelines)
+
+
+def _robots_path(path: str) -> str:
+    # Same normalisation RobotFileParser.can_fetch applies before matching
+    parsed = urlparse(unquote(path))
+    return quote(urlunparse(("", "", parsed.path, parsed.params, parsed.query, parsed.fragment))) or "/"
+
+
+def _looks_like_judgment(text: str) -> bool:
+    # Heuristic threshold: consider it a judgment if long enough
+    return len(text) > 1500 and JUDGMENT_RE.search(text) is not None
+
+
+def _anchors(tree: LexborHTMLParser) -> list[tuple[str, str]]:
+    # One pass over all links; callers derive everything else from this list
+    return [(a.attributes.get("href") or "", a.text()) for a in tree.css(SEL_A)]
+
+
+def _find_short_link(anchors: list[tuple[str, str]]) -> Optional[str]:
+    # Some case entries have a canonical short URL like /2025,17804 in the citation block
+    for href, _ in anchors:
+        if href.startswith("/") and any(ch.isdigit() for ch in href[:6]) and "," in href:
+            return href
+    return None
+
+
+def _extract_sections(tree: LexborHTMLParser) -> dict[str, str]:
+    # Leitsatz and Tenor blocks heuristically by headings, all in one pass
+    sections = dict.fromkeys(SECTION_HEADINGS, "")
+    for h in tree.css(SEL_HEADINGS):
+        label = _clean_text(h.text()).lower()
+        for key, words in SECTION_HEADINGS.items():
+            if sections[key] or not any(w in label for w in words):
+                continue
+            # collect following siblings until next heading
+            parts: list[str] = []
+            sib = h.next
+            while sib is not None and sib.tag not in ("h1", "h2", "h3", "strong"):
+                txt = _clean_text(sib.text(separator=" "))
+                if txt:
+                    parts.append(txt)
+                sib = sib.next
+            sections[key] = "\n\n".join(parts)
+        if all(sections.values()):
+            break
+    return sections
+
+
+def _parse_page(html: bytes) -> Optional[tuple[LexborHTMLParser, list[tuple[str, str]]]]:
+    # Tree and links of a case page, or None if the page opts out via meta robots
+    tree = LexborHTMLParser(html)
+    if _is_meta_disallowed(tree):
+        return None
+    return tree, _anchors(tree)
+
+
+def _parse_anchors(html: bytes) -> list[tuple[str, str]]:
+    return _anchors(LexborHTMLParser(html))
 
 
 class DejureScraper:
@@ -129,26 +271,57 @@ class DejureScraper:
         user_agent: str = "gesagent-dejurescrape/1.0",
         court_filter: Optional[str] = None,
         max_pages: Optional[int] = 50,
+        concurrency: int = 4,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.start_path = start_path
         self.delay_seconds = max(0.0, delay_seconds)
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
         self.court_filter = (court_filter or "").lower() or None
         self.max_pages = max_pages
+        self.concurrency = max(1, concurrency)
+        # One pooled session for dejure and every full-text host. The default
+        # pool (10 hosts, 10 connections each) is too small for the number of
+        # distinct hosts and concurrent workers, and would drop keep-alive
+        # connections early.
+        self.session = requests.Session()
+        pool_size = max(32, self.concurrency)
+        # Transport errors and gateway failures are retried by urllib3 on the
+        # pooled connection; _get handles the remaining server errors.
+        # Retry-After is left to _get, which caps it: urllib3 would otherwise
+        # also retry 429/503 and sleep for whatever the header says.
+        transport_retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 504),
+            respect_retry_after_header=False,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=transport_retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": user_agent})
+        self._pages_visited = 0
+        # Queued cases that have not yet taken their page from the budget
+        self._cases_pending = 0
+        self._next_slot: dict[str, float] = {}
+        self._sem = asyncio.Semaphore(self.concurrency)
+        self._fulltext_cache: OrderedDict[str, str] = OrderedDict()
+        self._fulltext_inflight: dict[str, asyncio.Task[str]] = {}
 
         # robots
         self.ignore_robots = False
         self.robots = urllib.robotparser.RobotFileParser()
+        self._robots_rules: Optional[tuple[re.Pattern[str], tuple[bool, ...]]] = None
         robots_url = f"{self.base_url}/robots.txt"
         try:
             # Fetch robots.txt directly to inspect content type
-            r = requests.get(robots_url, timeout=10, headers={"User-Agent": user_agent})
+            r = self.session.get(robots_url, timeout=10)
             ct = (r.headers.get("content-type") or "").lower()
-            body = r.text
+            body = r.content.decode("utf-8", errors="replace")
             if "text/plain" in ct and "user-agent" in body.lower():
                 self.robots.parse(body.splitlines())
+                self._robots_rules = _compile_robots(self.robots, user_agent)
             else:
                 # Non-standard robots -> default to allow
                 self.ignore_robots = True
@@ -156,16 +329,11 @@ class DejureScraper:
             self.ignore_robots = True
 
     def _allowed(self, path: str) -> bool:
-        if self.ignore_robots:
+        if self.ignore_robots or self._robots_rules is None:
             return True
-        try:
-            return self.robots.can_fetch(self.session.headers.get("User-Agent", "*"), f"{self.base_url}{path}")
-        except Exception:
-            return True
-
-    def _sleep(self) -> None:
-        if self.delay_seconds:
-            time.sleep(self.delay_seconds)
+        pattern, allowance = self._robots_rules
+        m = pattern.match(_robots_path(path))
+        return True if m is None else allowance[m.lastindex - 1]
 
     def _abs(self, href: str) -> str:
         if href.startswith("http://") or href.startswith("https://"):
@@ -174,255 +342,279 @@ class DejureScraper:
             href = "/" + href
         return f"{self.base_url}{href}"
 
-    def run(self) -> Iterator[CaseRecord]:
-        pages_visited = 0
-
-        # 1) Fetch courts index
-        start_url = f"{self.base_url}{self.start_path}"
-        if not self._allowed(self.start_path):
+    def _take_page(self) -> bool:
+        if self.max_pages and self._pages_visited >= self.max_pages:
+            return False
+        self._pages_visited += 1
+        return True
+
+    async def _throttle(self, url: str) -> None:
+        # Per-host politeness: request starts against one host are spaced
+        # delay_seconds / concurrency apart, so each host sees the same
+        # average rate a single worker sleeping delay_seconds would produce
+        # times the number of workers.
+        if not self.delay_seconds:
             return
-        self._sleep()
-        resp = _get(self.session, start_url)
-        soup = BeautifulSoup(resp.text, "lxml")
+        loop = asyncio.get_running_loop()
+        host = urlsplit(url).netloc
+        now = loop.time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.delay_seconds / self.concurrency
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _fetch(self, url: str) -> tuple[requests.Response, bytes]:
+        async with self._sem:
+            await self._throttle(url)
+            return await asyncio.to_thread(_download, self.session, url)
+
+    async def _fetch_full_text_from_targets(self, ordered: list[str]) -> str:
+        async def fetch_target(url: str) -> str:
+            try:
+                r, html = await self._fetch(url)
+            except Exception:
+                return ""
+            if not (r.headers.get("content-type") or "").lower().startswith("text/html"):
+                return ""
+            text = await asyncio.to_thread(lambda: _extract_main_text(LexborHTMLParser(html)))
+            return text if _looks_like_judgment(text) else ""
+
+        def store(key: str, task: asyncio.Task[str]) -> None:
+            self._fulltext_inflight.pop(key, None)
+            if task.cancelled() or task.exception() is not None:
+                return
+            cache = self._fulltext_cache
+            cache[key] = task.result()
+            if len(cache) > FULLTEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        async def try_target(key: str, url: str) -> str:
+            # Many cases cite the same decision page; misses are cached too.
+            # Concurrent cases share one in-flight fetch per key.
+            cache = self._fulltext_cache
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+            task = self._fulltext_inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fetch_target(url))
+                self._fulltext_inflight[key] = task
+                task.add_done_callback(lambda t: store(key, t))
+            # A cancelled waiter must not cancel the fetch other cases wait on
+            return await asyncio.shield(task)
+
+        # The normalised URL is only the cache key; the link is fetched as given
+        targets: dict[str, str] = {}
+        for url in ordered:
+            targets.setdefault(url.split("#", 1)[0].rstrip("/"), url)
+        hops = list(targets.items())[:MAX_FULLTEXT_HOPS]
+
+        # All targets are fetched concurrently; the first qualifying one in
+        # preference order wins.
+        for text in await asyncio.gather(*(try_target(key, url) for key, url in hops)):
+            if text:
+                return text
+        return ""
 
-        # From the index page itself, collect any prominently listed case links
+    @staticmethod
+    def _case_links(anchors: list[tuple[str, str]]) -> list[str]:
         case_paths: list[str] = []
-        for a in soup.select("a"):
-            href = a.get("href") or ""
+        for href, txt in anchors:
             if not href.startswith("/"):
                 continue
-            txt = _clean_text(a.get_text())
+            txt = _clean_text(txt)
             # Example text: "BGH, 12.06.2025 - III ZR 109/24"
-            if href.startswith("/dienste/vernetzung/rechtsprechung") and (" - " in txt or any(k in txt for k in ("ZR", "ZB", "StR", "BvR", "C-", "AZ", "Az."))):
+            if href.startswith("/dienste/vernetzung/rechtsprechung") and (" - " in txt or AZ_TOKEN_RE.search(txt)):
                 case_paths.append(href)
-
-        # Deduplicate case paths gathered on index
         seen = set()
-        case_paths = [x for x in case_paths if not (x in seen or seen.add(x))]
-
-        # 2) Visit case pages gathered from index and extract fields
-        for path in case_paths:
-            if self.max_pages and pages_visited >= self.max_pages:
-                break
-            if not self._allowed(path):
-                continue
-            self._sleep()
-            r = _get(self.session, self._abs(path))
-            pages_visited += 1
-            soup = BeautifulSoup(r.text, "lxml")
-            if _is_meta_disallowed(soup):
-                continue
-
-            # Some case entries have a canonical short URL like /2025,17804 in the citation block
+        return [x for x in case_paths if not (x in seen or seen.add(x))]
+
+    def _extract_case(
+        self, url: str, tree: LexborHTMLParser, anchors: list[tuple[str, str]]
+    ) -> tuple[CaseRecord, list[str]]:
+        # CPU-bound half of a case: fields from the parsed page, plus its
+        # full-text targets (preferred hosts first). Runs on a worker thread.
+        rec: CaseRecord = {"url": url}
+
+        # Title
+        title = tree.css_first("h1") or tree.css_first("title")
+        rec["title"] = _clean_text(title.text()) if title is not None else ""
+
+        # Court, Date, File number (heuristics)
+        # Often presented near the top, sometimes in a breadcrumb or header block
+        header_text = " ".join(el.text(separator=" ") for el in tree.css(SEL_HEADERS)[:5])
+        header_text = _clean_text(header_text)
+        if not header_text and title is not None:
+            header_text = _clean_text(title.text())
+        # Try to parse date
+        rec["date"] = _parse_date(header_text)
+
+        # File number heuristic: look for common patterns like "- X ZR 123/20 -" or "Az.: 2 StR 45/22"
+        text_candidates = header_text + " " + " ".join(p.text(separator=" ") for p in tree.css(SEL_AZ))
+        rec["file_number"] = _parse_file_number(_clean_text(text_candidates))
+
+        # Court heuristic: try from breadcrumbs or header
+        court = ""
+        crumbs = tree.css(SEL_BREADCRUMB)
+        if crumbs:
+            court = _clean_text(crumbs[-1].text())
+        if not court:
+            # fallback: from header chunks
+            court = _parse_court(header_text)
+        rec["court"] = court
+
+        sections = _extract_sections(tree)
+        rec["leitsatz"] = sections["leitsatz"]
+        rec["tenor"] = sections["tenor"]
+
+        # References to laws and other cases, and full-text targets on
+        # preferred hosts
+        refs: dict[str, list[str]] = {"laws": [], "cases": []}
+        preferred: list[tuple[int, str]] = []
+        for href, _ in anchors:
+            if href.startswith("/gesetze"):
+                refs["laws"].append(self._abs(href))
+            elif CASE_REF_RE.search(href):
+                refs["cases"].append(self._abs(href))
+            m = HOST_RE.search(href)
+            if m and (href.startswith("http") or href.startswith("/")):
+                preferred.append((HOST_RANK[m.group(0)], self._abs(href)))
+        # Deduplicate
+        refs = {k: sorted(set(v)) for k, v in refs.items()}
+        if any(refs.values()):
+            rec["references"] = refs
+
+        # The judgment is often on the dejure page itself; then no external hop is needed
+        local = _extract_main_text(tree)
+        if _looks_like_judgment(local):
+            rec["full_text"] = local
+            return rec, []
+        preferred.sort(key=lambda t: t[0])
+        return rec, [url for _, url in preferred]
+
+    async def _process_case(self, path: str) -> Optional[CaseRecord]:
+        if not self._allowed(path) or not self._take_page():
+            return None
+        _, html = await self._fetch(self._abs(path))
+        page = await asyncio.to_thread(_parse_page, html)
+        if page is None:
+            return None
+        tree, anchors = page
+
+        short = _find_short_link(anchors)
+        if short and not (self._allowed(short) and self._take_page()):
+            # Out of page budget: extract from the case page already in hand
             short = None
-            for a in soup.find_all("a"):
-                href = a.get("href") or ""
-                if href.startswith("/") and any(ch.isdigit() for ch in href[:6]) and "," in href:
-                    short = href
-                    break
-            if short and self._allowed(short):
-                # fetch short page for consistent parsing
-                self._sleep()
-                r2 = _get(self.session, self._abs(short))
-                pages_visited += 1
-                soup = BeautifulSoup(r2.text, "lxml")
-                if _is_meta_disallowed(soup):
-                    continue
-
-            rec: CaseRecord = {"url": self._abs(short or path)}
-
-            # Title
-            title = soup.find("h1") or soup.find("title")
-            rec["title"] = _clean_text(title.get_text()) if title else ""
-
-            # Court, Date, File number (heuristics)
-            # Often presented near the top, sometimes in a breadcrumb or header block
-            header_text = " ".join(el.get_text(separator=" ") for el in soup.select("h1, h2, .kopf, .header, .entscheidung, .az, .aktenzeichen")[:5])
-            header_text = _clean_text(header_text)
-            if not header_text and title:
-                header_text = _clean_text(title.get_text())
-            # Try to parse date
-            date_str = ""
-            for chunk in header_text.split(" "):
-                try:
-                    dt = dateparser.parse(chunk, dayfirst=True, fuzzy=True)
-                    if 1900 <= dt.year <= 2100:
-                        date_str = dt.date().isoformat()
-                        break
-                except Exception:
-                    pass
-            rec["date"] = date_str
-
-            # File number heuristic: look for common patterns like "- X ZR 123/20 -" or "Az.: 2 StR 45/22"
-            az = ""
-            text_candidates = header_text + " " + " ".join(p.get_text(" ") for p in soup.select(".az, .aktenzeichen"))
-            text_candidates = _clean_text(text_candidates)
-            for token in text_candidates.split(" "):
-                if any(sep in token for sep in ("/", "-")) and any(k in token for k in ("ZR", "ZB", "StR", "BvR", "AZ", "Az.", "C-")):
-                    az = token.strip(";,.()[]")
-                    break
-            rec["file_number"] = az
-
-            # Court heuristic: try from breadcrumbs or header
-            court = ""
-            crumbs = soup.select(".breadcrumb a, nav.breadcrumb a")
-            if crumbs:
-                court = _clean_text(crumbs[-1].get_text())
-            if not court:
-                # fallback: from header chunks
-                for kw in ("BVerfG", "BGH", "BAG", "BSG", "BFH", "EuGH", "EGMR", "VG", "OVG", "VGH", "LG", "OLG", "AG"):
-                    if kw in header_text:
-                        court = kw
-                        break
-            rec["court"] = court
-
-            # Leitsatz and Tenor blocks heuristically by headings
-            def extract_section(heading_words: tuple[str, ...]) -> str:
-                for h in soup.find_all(["h2", "h3", "strong"]):
-                    ht = _clean_text(h.get_text()).lower()
-                    if any(w.lower() in ht for w in heading_words):
-                        # collect following siblings until next heading
-                        parts: list[str] = []
-                        for sib in h.next_siblings:
-                            if getattr(sib, "name", None) in ("h1", "h2", "h3", "strong"):
-                                break
-                            txt = _clean_text(getattr(sib, "get_text", lambda *_: str(sib))(" "))
-                            if txt:
-                                parts.append(txt)
-                        return "\n\n".join(parts).strip()
-                return ""
-
-            rec["leitsatz"] = extract_section(("Leitsatz",))
-            rec["tenor"] = extract_section(("Tenor",))
-
-            # References: collect links to laws and other cases
-            refs: dict[str, list[str]] = {"laws": [], "cases": []}
-            for a in soup.select("a"):
-                href = a.get("href") or ""
-                if href.startswith("/gesetze"):
-                    refs["laws"].append(self._abs(href))
-                elif any(seg in href for seg in ("/urteil", "/entscheidung", "/rechtsprechung")):
-                    refs["cases"].append(self._abs(href))
-            # Deduplicate
-            refs = {k: sorted(set(v)) for k, v in refs.items()}
-            if any(refs.values()):
-                rec["references"] = refs
-
-            # Full text: follow external official links if available
-            full_text = _fetch_full_text_from_targets(self.session, self.base_url, soup, self.delay_seconds)
+        if short:
+            # fetch short page for consistent parsing
+            _, html = await self._fetch(self._abs(short))
+            page = await asyncio.to_thread(_parse_page, html)
+            if page is None:
+                return None
+            tree, anchors = page
+
+        rec, targets = await asyncio.to_thread(self._extract_case, self._abs(short or path), tree, anchors)
+
+        # Full text: follow external official links if available
+        if targets:
+            full_text = await self._fetch_full_text_from_targets(targets)
             if full_text:
                 rec["full_text"] = full_text
+        return rec
+
+    async def _discover(self, case_q: asyncio.Queue[Optional[str]]) -> None:
+        # Producer stage: queue case paths from the index, then from each court page
+        seen: set[str] = set()
+
+        async def enqueue(anchors: list[tuple[str, str]]) -> None:
+            for path in self._case_links(anchors):
+                if path not in seen:
+                    seen.add(path)
+                    self._cases_pending += 1
+                    await case_q.put(path)
+
+        # 1) Fetch courts index
+        if not self._allowed(self.start_path):
+            return
+        _, html = await self._fetch(f"{self.base_url}{self.start_path}")
+        index = await asyncio.to_thread(_parse_anchors, html)
 
-            yield rec
+        # 2) Case pages prominently listed on the index
+        await enqueue(index)
 
         # 3) Optionally: follow court pages to discover additional cases (best-effort)
         court_links: list[str] = []
-        for a in soup.select("a"):
-            text = _clean_text(a.get_text())
-            href = a.get("href") or ""
+        for href, text in index:
             if not href or not href.startswith("/"):
                 continue
-            if self.court_filter and self.court_filter not in text.lower():
+            if self.court_filter and self.court_filter not in _clean_text(text).lower():
                 continue
-            if any(seg in href for seg in ("/gesetze", "/corona", "/benutzer", "/stellenmarkt", "/dienste/vernetzung/rechtsprechung")):
+            if SKIP_SEG_RE.search(href):
                 continue
             court_links.append(href)
 
-        seen = set()
-        court_links = [x for x in court_links if not (x in seen or seen.add(x))]
-
-        for path in court_links:
-            if self.max_pages and pages_visited >= self.max_pages:
-                break
+        for path in dict.fromkeys(court_links):
             if not self._allowed(path):
                 continue
-            self._sleep()
-            r = _get(self.session, self._abs(path))
-            pages_visited += 1
-            psoup = BeautifulSoup(r.text, "lxml")
-            local_cases: list[str] = []
-            for a in psoup.find_all("a"):
-                href = a.get("href") or ""
-                if not href.startswith("/"):
-                    continue
-                txt = _clean_text(a.get_text())
-                if href.startswith("/dienste/vernetzung/rechtsprechung") and (" - " in txt or any(k in txt for k in ("ZR", "ZB", "StR", "BvR", "C-", "AZ", "Az."))):
-                    local_cases.append(href)
-
-            seen = set()
-            local_cases = [x for x in local_cases if not (x in seen or seen.add(x))]
-            for cpath in local_cases:
-                if self.max_pages and pages_visited >= self.max_pages:
-                    break
-                if not self._allowed(cpath):
-                    continue
-                self._sleep()
-                rr = _get(self.session, self._abs(cpath))
-                pages_visited += 1
-                csoup = BeautifulSoup(rr.text, "lxml")
-                if _is_meta_disallowed(csoup):
-                    continue
-                short = None
-                for a in csoup.find_all("a"):
-                    href = a.get("href") or ""
-                    if href.startswith("/") and any(ch.isdigit() for ch in href[:6]) and "," in href:
-                        short = href
-                        break
-                if short and self._allowed(short):
-                    self._sleep()
-                    rr2 = _get(self.session, self._abs(short))
-                    pages_visited += 1
-                    csoup = BeautifulSoup(rr2.text, "lxml")
-                    if _is_meta_disallowed(csoup):
-                        continue
-
-                title = csoup.find("h1") or csoup.find("title")
-                header_text = _clean_text(title.get_text()) if title else ""
-
-                date_str = ""
-                for chunk in header_text.split(" "):
-                    try:
-                        dt = dateparser.parse(chunk, dayfirst=True, fuzzy=True)
-                        if 1900 <= dt.year <= 2100:
-                            date_str = dt.date().isoformat()
-                            break
-                    except Exception:
-                        pass
-
-                az = ""
-                for token in header_text.split(" "):
-                    if any(sep in token for sep in ("/", "-")) and any(k in token for k in ("ZR", "ZB", "StR", "BvR", "AZ", "Az.", "C-")):
-                        az = token.strip(";,.()[]")
-                        break
-
-                court = ""
-                for kw in ("BVerfG", "BGH", "BAG", "BSG", "BFH", "EuGH", "EGMR", "VG", "OVG", "VGH", "LG", "OLG", "AG"):
-                    if kw in header_text:
-                        court = kw
-                        break
-
-                refs: dict[str, list[str]] = {"laws": [], "cases": []}
-                for a in csoup.select("a"):
-                    href = a.get("href") or ""
-                    if href.startswith("/gesetze"):
-                        refs["laws"].append(self._abs(href))
-                    elif any(seg in href for seg in ("/urteil", "/entscheidung", "/rechtsprechung")):
-                        refs["cases"].append(self._abs(href))
-                refs = {k: sorted(set(v)) for k, v in refs.items()}
-
-                out: CaseRecord = {
-                    "url": self._abs(short or cpath),
-                    "title": header_text,
-                    "date": date_str,
-                    "file_number": az,
-                    "court": court,
-                }
-                if any(refs.values()):
-                    out["references"] = refs
-                # Full text
-                full_text = _fetch_full_text_from_targets(self.session, self.base_url, csoup, self.delay_seconds)
-                if full_text:
-                    out["full_text"] = full_text
-                yield out
+            # Queued cases have first claim on the page budget; only when they
+            # would use it up does the producer wait to see what is left
+            if self.max_pages and self._pages_visited + self._cases_pending >= self.max_pages:
+                await case_q.join()
+            if not self._take_page():
+                break
+            _, html = await self._fetch(self._abs(path))
+            await enqueue(await asyncio.to_thread(_parse_anchors, html))
+
+    async def _work(self, case_q: asyncio.Queue[Optional[str]], out_q: asyncio.Queue[Optional[CaseRecord]]) -> None:
+        # Consumer stage: fetch, parse and extract queued cases until the sentinel
+        while (path := await case_q.get()) is not None:
+            self._cases_pending -= 1
+            try:
+                rec = await self._process_case(path)
+            finally:
+                case_q.task_done()
+            if rec is not None:
+                await out_q.put(rec)
+
+    async def _pipeline(self, out_q: asyncio.Queue[Optional[CaseRecord]]) -> None:
+        # Twice as many workers as fetch slots, so some parse while others wait on I/O
+        n_workers = 2 * self.concurrency
+        case_q: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=4 * n_workers)
+
+        async def produce() -> None:
+            await self._discover(case_q)
+            for _ in range(n_workers):
+                await case_q.put(None)
+
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(self._work(case_q, out_q)) for _ in range(n_workers)]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for t in done:
+                t.result()
+        finally:
+            for t in tasks:
+                t.cancel()
+            out_q.put_nowait(None)
+
+    async def run_async(self) -> AsyncIterator[CaseRecord]:
+        """Crawl concurrently, yielding records as soon as each case completes."""
+        self._pages_visited = 0
+        self._cases_pending = 0
+        self._next_slot.clear()
+        self._sem = asyncio.Semaphore(self.concurrency)
+
+        out_q: asyncio.Queue[Optional[CaseRecord]] = asyncio.Queue()
+        pipeline = asyncio.create_task(self._pipeline(out_q))
+        try:
+            while (rec := await out_q.get()) is not None:
+                yield rec
+            await pipeline
+        finally:
+            pipeline.cancel()
 
+    async def _collect(self) -> list[CaseRecord]:
+        return [rec async for rec in self.run_async()]
 
+    def run(self) -> Iterator[CaseRecord]:
+        return iter(asyncio.run(self._collect()))
@@ -0,0 +1,63 @@
+import hashlib
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("orjson")
+pytest.importorskip("requests")
+pytest.importorskip("selectolax")
+pytest.importorskip("tenacity")
+
+from dejurescrape.cli import _CSV_KEYS, _ensure_csv_schema
+
+HEADER = ",".join(_CSV_KEYS)
+DIGEST = hashlib.sha256(HEADER.encode("utf-8")).hexdigest()
+
+
+def test_csv_schema_matching_header_is_kept(tmp_path):
+    path = tmp_path / "cases.csv"
+    content = HEADER + "\r\nhttps://dejure.org/1,BGH,2025-06-12,,,,,\r\n"
+    path.write_bytes(content.encode("utf-8"))
+
+    _ensure_csv_schema(path, _CSV_KEYS)
+
+    assert path.read_bytes() == content.encode("utf-8")
+    assert path.with_suffix(".schema").read_text(encoding="utf-8").strip() == DIGEST
+
+
+def test_csv_schema_old_header_is_migrated(tmp_path):
+    path = tmp_path / "cases.csv"
+    path.write_text("url,title,court,obsolete\nhttps://dejure.org/1,T,BGH,x\n", encoding="utf-8")
+
+    _ensure_csv_schema(path, _CSV_KEYS)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines == [HEADER, "https://dejure.org/1,BGH,,,T,,,"]
+    assert path.with_suffix(".schema").read_text(encoding="utf-8").strip() == DIGEST
+
+
+def test_csv_schema_empty_file_gets_header(tmp_path):
+    path = tmp_path / "cases.csv"
+    path.touch()
+
+    _ensure_csv_schema(path, _CSV_KEYS)
+
+    assert path.read_text(encoding="utf-8").splitlines() == [HEADER]
+
+
+def test_csv_schema_sidecar_skips_read(tmp_path, monkeypatch):
+    path = tmp_path / "cases.csv"
+    path.write_text("not,the,header\n", encoding="utf-8")
+    path.with_suffix(".schema").write_text(DIGEST + "\n", encoding="utf-8")
+
+    real_open = Path.open
+
+    def guarded_open(self, *args, **kwargs):
+        assert self != path, "CSV opened despite a valid .schema sidecar"
+        return real_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", guarded_open)
+    _ensure_csv_schema(path, _CSV_KEYS)
+
+    monkeypatch.undo()
+    assert path.read_text(encoding="utf-8") == "not,the,header\n"
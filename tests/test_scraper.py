@@ -0,0 +1,91 @@
+import urllib.robotparser
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("selectolax")
+pytest.importorskip("tenacity")
+
+from selectolax.lexbor import LexborHTMLParser
+
+from dejurescrape._fast import _extract_main_text
+from dejurescrape.scraper import (
+    JUDGMENT_RE,
+    DejureScraper,
+    _compile_robots,
+    _looks_like_judgment,
+    _to_utf8,
+)
+
+
+@pytest.mark.parametrize("marker", ["Tatbestand", "Entscheidungsgründe", "Tenor", "Gründe"])
+def test_judgment_markers(marker):
+    assert JUDGMENT_RE.search(f"... {marker} ...")
+    assert _looks_like_judgment("x " * 800 + marker)
+
+
+def test_judgment_requires_marker_and_length():
+    assert not _looks_like_judgment("x " * 800)
+    assert not _looks_like_judgment("Entscheidungsgründe")
+
+
+LATIN1_PAGE = "<html><head>{meta}</head><body><main>Gr\xfcnde</main></body></html>"
+
+
+@pytest.mark.parametrize(
+    "body, charset, expected",
+    [
+        (LATIN1_PAGE.format(meta="").encode("utf-8"), "", "Gründe"),
+        (LATIN1_PAGE.format(meta="").encode("latin-1"), "iso-8859-1", "Gründe"),
+        (LATIN1_PAGE.format(meta='<meta charset="iso-8859-1">').encode("latin-1"), "", "Gründe"),
+        (LATIN1_PAGE.format(meta="").encode("latin-1"), "", "Gr\ufffdnde"),
+    ],
+)
+def test_to_utf8_keeps_text_parseable(body, charset, expected):
+    assert _extract_main_text(LexborHTMLParser(_to_utf8(body, charset))) == expected
+
+
+ROBOTS_TXT = """\
+User-agent: otherbot
+Disallow: /
+
+User-agent: starbot
+Allow: /gerichte
+Disallow: *
+
+User-agent: *
+Allow: /gesetze/BGB
+Disallow: /gesetze/
+Disallow: /benutzer
+Disallow: /suche%20alt
+Disallow: /dienste/vernetzung/rechtsprechung?Text=
+Disallow:
+"""
+
+
+@pytest.mark.parametrize("useragent", ["dejurescrape", "otherbot", "starbot", "*"])
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/",
+        "/gerichte",
+        "/gesetze/BGB/823.html",
+        "/gesetze/StGB/1.html",
+        "/gesetze",
+        "/benutzer/login",
+        "/benutzerhandbuch",
+        "/suche alt",
+        "/suche%20alt/x",
+        "/dienste/vernetzung/rechtsprechung?Text=III%20ZR%20109/24",
+        "/dienste/vernetzung/rechtsprechung",
+        "/2025,17804",
+        "",
+    ],
+)
+def test_allowed_matches_robotparser(useragent, path):
+    robots = urllib.robotparser.RobotFileParser()
+    robots.parse(ROBOTS_TXT.splitlines())
+    scraper = DejureScraper.__new__(DejureScraper)
+    scraper.ignore_robots = False
+    scraper._robots_rules = _compile_robots(robots, useragent)
+    assert scraper._allowed(path) == robots.can_fetch(useragent, path)